@@ -3,6 +3,7 @@
 from dataclasses import asdict, is_dataclass
 from datetime import date, datetime
 from enum import Enum
+from functools import cache
 import platform
 from typing import Any
 import uuid
@@ -12,6 +13,8 @@ import aiohttp
 from .const import DEVELOPER_ID, __version__
 from .types import HabiticaUserResponse, UserData, UserStyles
 
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
 
 def join_fields(user_fields: list[str] | str) -> str:
     """Join user fields into a comma-separated string.
@@ -35,12 +38,14 @@ def join_fields(user_fields: list[str] | str) -> str:
     return ",".join(user_fields) if isinstance(user_fields, list) else str(user_fields)
 
 
+@cache
 def get_user_agent() -> str:
     """Generate User-Agent string.
 
     The User-Agent string contains details about the operating system,
     its version, architecture, the habiticalib version, aiohttp version,
-    and Python version.
+    and Python version. The result is cached, as probing the platform is
+    slow and the details do not change while the process runs.
 
     Returns
     -------
@@ -114,12 +119,27 @@ def get_x_client(x_client: str | None = None) -> str:
 def extract_user_styles(user_data: HabiticaUserResponse) -> UserStyles:
     """Extract user styles from a user data object."""
     data: UserData = user_data.data
-    return UserStyles.from_dict(asdict(data))
+    # Only convert the parts UserStyles is built from, asdict() on the whole
+    # UserData would walk and copy every field including history and tags
+    return UserStyles.from_dict(
+        {
+            "items": asdict(data.items),
+            "preferences": asdict(data.preferences),
+            "stats": asdict(data.stats),
+        }
+    )
 
 
 def deserialize_task(value: Any) -> Any:  # noqa: PLR0911
     """Recursively convert Enums to values, dates to ISO strings, UUIDs to strings."""
 
+    if type(value) in _SCALAR_TYPES:
+        # Fast path for plain JSON scalars, which make up most of a task payload.
+        # Exact type check so StrEnum members still fall through to `.value`
+        return value
+    if isinstance(value, dict):
+        # Recursively apply deserialization to each key-value pair in the dictionary
+        return {k: deserialize_task(v) for k, v in value.items()}
     if is_dataclass(value) and not isinstance(value, type):
         # Convert dataclass to dict and recursively deserialize
         return deserialize_task(asdict(value))
@@ -132,7 +152,4 @@ def deserialize_task(value: Any) -> Any:  # noqa: PLR0911
     if isinstance(value, list):
         # Recursively apply deserialization to each item in the list
         return [deserialize_task(item) for item in value]
-    if isinstance(value, dict):
-        # Recursively apply deserialization to each key-value pair in the dictionary
-        return {k: deserialize_task(v) for k, v in value.items()}
     return value  # Return other types unchanged
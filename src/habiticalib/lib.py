@@ -109,7 +109,7 @@ class Habitica:
         self._assets_cache: dict[str, IO[bytes]] = {}
         self._cache_order: list[str] = []
 
-    async def _request(self, method: str, url: URL, **kwargs) -> str:
+    async def _request(self, method: str, url: URL, **kwargs) -> bytes:
         """Handle API request."""
         async with self._session.request(
             method,
@@ -119,22 +119,23 @@ class Habitica:
         ) as r:
             if r.status == HTTPStatus.UNAUTHORIZED:
                 raise NotAuthorizedError(
-                    HabiticaErrorResponse.from_json(await r.text()), r.headers
+                    HabiticaErrorResponse.from_json(await r.read()), r.headers
                 )
             if r.status == HTTPStatus.NOT_FOUND:
                 raise NotFoundError(
-                    HabiticaErrorResponse.from_json(await r.text()), r.headers
+                    HabiticaErrorResponse.from_json(await r.read()), r.headers
                 )
             if r.status == HTTPStatus.BAD_REQUEST:
                 raise BadRequestError(
-                    HabiticaErrorResponse.from_json(await r.text()), r.headers
+                    HabiticaErrorResponse.from_json(await r.read()), r.headers
                 )
             if r.status == HTTPStatus.TOO_MANY_REQUESTS:
                 raise TooManyRequestsError(
-                    HabiticaErrorResponse.from_json(await r.text()), r.headers
+                    HabiticaErrorResponse.from_json(await r.read()), r.headers
                 )
             r.raise_for_status()
-            return await r.text()
+            # orjson decodes the raw body directly, no need to decode to str first
+            return await r.read()
 
     async def __aenter__(self) -> Self:
         """Async enter."""
@@ -2028,7 +2029,7 @@ class Habitica:
 
         if isinstance(fp, str):
             loop = asyncio.get_running_loop()
-            loop.run_in_executor(None, image.save, fp)
+            await loop.run_in_executor(None, image.save, fp)
         else:
             image.save(fp, fmt)
 
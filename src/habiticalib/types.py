@@ -7,45 +7,84 @@ from dataclasses import dataclass, field
 import datetime as dt
 from datetime import UTC, datetime
 from enum import Enum, StrEnum
+from functools import lru_cache
+import sys
 from typing import Any, NotRequired, TypedDict
 from uuid import UUID
 
 from mashumaro import field_options
+from mashumaro.config import BaseConfig
 from mashumaro.mixins.orjson import DataClassORJSONMixin
 
 
+@lru_cache(maxsize=4096)
 def serialize_datetime(date: str | int | None) -> datetime | None:
-    """Convert an iso date to a datetime.date object."""
+    """Convert an iso date to a datetime.date object.
+
+    Results are cached, history entries and due dates repeat the same
+    timestamps many times within a single response.
+    """
     if isinstance(date, int):
         return datetime.fromtimestamp(date / 1000, tz=UTC)
     if isinstance(date, str):
+        # sometimes nextDue dates are JavaScript datetime strings
+        # instead of iso: "Mon May 06 2024 00:00:00 GMT+0200"
+        # This was fixed in Habitica v5.28.9, nextDue dates are now isoformat.
+        # The weekday abbreviation is followed by a space, which never occurs
+        # at that position in an iso date, so we can skip the failing
+        # fromisoformat call for the legacy format.
         try:
+            if date[3:4] == " ":
+                return datetime.strptime(date, "%a %b %d %Y %H:%M:%S %Z%z")
             return datetime.fromisoformat(date)
         except ValueError:
-            # sometimes nextDue dates are JavaScript datetime strings
-            # instead of iso: "Mon May 06 2024 00:00:00 GMT+0200"
-            # This was fixed in Habitica v5.28.9, nextDue dates are now isoformat
-            try:
-                return datetime.strptime(date, "%a %b %d %Y %H:%M:%S %Z%z")
-            except ValueError:
-                return None
+            return None
     return None
 
 
-@dataclass(kw_only=True)
+def intern_str(value: str | None) -> str | None:
+    """Intern strings drawn from a small, repeating set of values."""
+    return sys.intern(value) if value else value
+
+
+def serialize_datetime_list(dates: list[str | int]) -> list[datetime | None]:
+    """Convert a list of iso dates to datetime objects."""
+    return [serialize_datetime(date) for date in dates]
+
+
+@lru_cache(maxsize=1024)
+def serialize_uuid(value: str) -> UUID:
+    """Convert a string to a UUID.
+
+    Results are cached, tag, user and challenge ids repeat across tasks.
+    """
+    return UUID(value)
+
+
+def serialize_uuid_list(values: list[str]) -> list[UUID]:
+    """Convert a list of strings to UUIDs."""
+    return [serialize_uuid(value) for value in values]
+
+
+@dataclass(kw_only=True, slots=True)
 class NotificationsUser:
     """Notifications User data."""
 
-    Type: str = field(metadata=field_options(alias="type"))
+    Type: str = field(metadata=field_options(alias="type", deserialize=intern_str))
     data: dict[str, Any]
     seen: bool
     id: UUID
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HabiticaResponse(DataClassORJSONMixin):
     """Representation of a base Habitica API response."""
 
+    class Config(BaseConfig):
+        """Configuration options."""
+
+        lazy_compilation = True
+
     data: Any
     success: bool
     notifications: list[NotificationsUser] = field(default_factory=list)
@@ -53,7 +92,7 @@ class HabiticaResponse(DataClassORJSONMixin):
     appVersion: str | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class LoginData:
     """Login data."""
 
@@ -64,14 +103,14 @@ class LoginData:
     passwordResetCode: str | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HabiticaLoginResponse(HabiticaResponse):
     """Representation of a login data response."""
 
     data: LoginData
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class LocalAuth:
     """Auth local data."""
 
@@ -81,7 +120,7 @@ class LocalAuth:
     has_password: bool | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class LocalTimestamps:
     """Timestamps local data."""
 
@@ -90,7 +129,7 @@ class LocalTimestamps:
     updated: datetime | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class AuthUser:
     """User auth data."""
 
@@ -101,7 +140,7 @@ class AuthUser:
     apple: dict | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class UltimateGearSetsAchievments:
     """Achievments ultimateGearSets data."""
 
@@ -111,7 +150,7 @@ class UltimateGearSetsAchievments:
     warrior: bool | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class QuestsAchievments:
     """Achievments quests."""
 
@@ -132,7 +171,7 @@ class QuestsAchievments:
     dysheartener: int | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class AchievementsUser:
     """User achievments data."""
 
@@ -162,7 +201,7 @@ class AchievementsUser:
     partyUp: None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BackerUser:
     """User backer data."""
 
@@ -171,7 +210,7 @@ class BackerUser:
     tokensApplied: bool | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PermissionsUser:
     """User permissions data."""
 
@@ -183,7 +222,7 @@ class PermissionsUser:
     coupons: bool | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ContributorUser:
     """User contributer data."""
 
@@ -192,7 +231,7 @@ class ContributorUser:
     text: str | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ConsecutivePlan:
     """Plan consecutive data."""
 
@@ -202,7 +241,7 @@ class ConsecutivePlan:
     count: int | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PlanPurchased:
     """Purchased background data."""
 
@@ -215,7 +254,7 @@ class PlanPurchased:
     quantity: int | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PurchasedUser:
     """User purchased data."""
 
@@ -229,7 +268,7 @@ class PurchasedUser:
     mobileChat: bool | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TourFlags:
     """Flags tour data."""
 
@@ -248,7 +287,7 @@ class TourFlags:
     groupPlans: int | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CommonTutorial:
     """Tutorial common data."""
 
@@ -269,7 +308,7 @@ class CommonTutorial:
     stats: bool
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class IosTutorial:
     """Tutorial ios data."""
 
@@ -282,7 +321,7 @@ class IosTutorial:
     reorderTask: bool
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TutorialFlags:
     """Flags tutorial data."""
 
@@ -290,7 +329,7 @@ class TutorialFlags:
     ios: IosTutorial | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class FlagsUser:
     """User flags data."""
 
@@ -327,7 +366,7 @@ class FlagsUser:
     onboardingEmailsPhase: str | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class EntryHistory:
     """History entry data."""
 
@@ -343,7 +382,7 @@ class EntryHistory:
     completed: bool | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HistoryUser:
     """User history data."""
 
@@ -351,7 +390,7 @@ class HistoryUser:
     exp: list[EntryHistory] = field(default_factory=list)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class EquippedGear:
     """Gear equipped data."""
 
@@ -365,7 +404,7 @@ class EquippedGear:
     body: str | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class GearItems:
     """Items gear data."""
 
@@ -374,7 +413,7 @@ class GearItems:
     owned: dict[str, bool] = field(default_factory=dict)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SpecialItems:
     """Items special data."""
 
@@ -400,7 +439,7 @@ class SpecialItems:
     goodluckReceived: list = field(default_factory=list)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class LastDropItems:
     """LastDrop items data."""
 
@@ -408,7 +447,7 @@ class LastDropItems:
     date: datetime | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ItemsUser:
     """User items data."""
 
@@ -425,7 +464,7 @@ class ItemsUser:
     pets: dict[str, int] = field(default_factory=dict)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class InvitationsUser:
     """Invitations user data."""
 
@@ -434,7 +473,7 @@ class InvitationsUser:
     parties: list = field(default_factory=list)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ProgressQuest:
     """Quest progress data."""
 
@@ -444,7 +483,7 @@ class ProgressQuest:
     collectedItems: int | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class QuestParty:
     """Party quest data."""
 
@@ -454,7 +493,7 @@ class QuestParty:
     completed: str | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PartyUser:
     """Party user data."""
 
@@ -464,7 +503,7 @@ class PartyUser:
     _id: UUID | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HairPreferences:
     """Hair preferences data."""
 
@@ -476,7 +515,7 @@ class HairPreferences:
     flower: int | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class EmailNotificationsPreferences:
     """EmailNotifications preferences data."""
 
@@ -498,7 +537,7 @@ class EmailNotificationsPreferences:
     contentRelease: bool | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PushNotificationsPreferences:
     """PushNotifications preferences data."""
 
@@ -519,7 +558,7 @@ class PushNotificationsPreferences:
     contentRelease: bool | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SuppressModalsPreferences:
     """SupressModals preferences data."""
 
@@ -529,7 +568,7 @@ class SuppressModalsPreferences:
     streak: bool | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ActiveFilterTask:
     """ActiveFilter task data."""
 
@@ -539,7 +578,7 @@ class ActiveFilterTask:
     reward: str | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TasksPreferences:
     """Tasks preferences data."""
 
@@ -549,7 +588,7 @@ class TasksPreferences:
     mirrorGroupTasks: list[UUID] = field(default_factory=list)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PreferencesUser:
     """Preferences user data."""
 
@@ -575,7 +614,9 @@ class PreferencesUser:
     allocationMode: str | None = None
     autoEquip: bool | None = None
     costume: bool | None = None
-    dateFormat: str | None = None
+    dateFormat: str | None = field(
+        default=None, metadata=field_options(deserialize=intern_str)
+    )
     sleep: bool | None = None
     stickyHeader: bool | None = None
     disableClasses: bool | None = None
@@ -594,7 +635,7 @@ class PreferencesUser:
     language: Language | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ProfileUser:
     """Profile user data."""
 
@@ -603,7 +644,7 @@ class ProfileUser:
     name: str | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BuffsStats:
     """Buffs stats data."""
 
@@ -619,7 +660,7 @@ class BuffsStats:
     Int: int | None = field(default=None, metadata=field_options(alias="int"))
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TrainingStats:
     """Training stats data."""
 
@@ -638,7 +679,10 @@ class HabiticaClass(StrEnum):
     HEALER = "healer"
 
 
-@dataclass(kw_only=True)
+HABITICA_CLASSES = {m.value: m for m in HabiticaClass}
+
+
+@dataclass(kw_only=True, slots=True)
 class StatsUser:
     """Stats user data."""
 
@@ -650,7 +694,8 @@ class StatsUser:
     gp: float | None = None
     lvl: int | None = None
     Class: HabiticaClass | None = field(
-        default=None, metadata=field_options(alias="class")
+        default=None,
+        metadata=field_options(alias="class", deserialize=HABITICA_CLASSES.__getitem__),
     )
     points: int | None = None
     Str: int | None = field(default=None, metadata=field_options(alias="str"))
@@ -662,7 +707,7 @@ class StatsUser:
     Int: int | None = field(default=None, metadata=field_options(alias="int"))
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TagsUser:
     """Tags user data."""
 
@@ -672,7 +717,7 @@ class TagsUser:
     group: str | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class InboxUser:
     """Inbox user data."""
 
@@ -682,7 +727,7 @@ class InboxUser:
     messages: dict = field(default_factory=dict)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TasksOrderUser:
     """TasksOrder user data."""
 
@@ -692,22 +737,22 @@ class TasksOrderUser:
     rewards: list[UUID] = field(default_factory=list)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PushDevicesUser:
     """PushDevices user data."""
 
     regId: str
-    Type: str = field(metadata=field_options(alias="type"))
+    Type: str = field(metadata=field_options(alias="type", deserialize=intern_str))
     createdAt: datetime
     updatedAt: datetime
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class WebhooksUser:
     """Webhooks user data."""
 
     id: UUID
-    Type: str = field(metadata=field_options(alias="type"))
+    Type: str = field(metadata=field_options(alias="type", deserialize=intern_str))
     label: str
     url: str
     enabled: bool
@@ -715,15 +760,15 @@ class WebhooksUser:
     lastFailureAt: datetime | None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PinnedItemsUser:
     """PinnedItems user data."""
 
     path: str
-    Type: str = field(metadata=field_options(alias="type"))
+    Type: str = field(metadata=field_options(alias="type", deserialize=intern_str))
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class UserData:
     """User data."""
 
@@ -763,21 +808,21 @@ class UserData:
     newMessages: dict[str, bool] = field(default_factory=dict)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HabiticaUserResponse(HabiticaResponse):
     """Representation of a user data response."""
 
     data: UserData
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HabiticaGroupMembersResponse(HabiticaResponse):
     """Representation of a group members data response."""
 
     data: list[UserData]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CompletedBy:
     """Task group completedby data."""
 
@@ -785,7 +830,7 @@ class CompletedBy:
     date: datetime | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class GroupTask:
     """Task group data."""
 
@@ -799,7 +844,7 @@ class GroupTask:
     completedBy: CompletedBy = field(default_factory=CompletedBy)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Repeat:
     """Task repeat data."""
 
@@ -822,18 +867,26 @@ class ChallengeAbortedReason(StrEnum):
     CHALLENGE_TASK_NOT_FOUND = "CHALLENGE_TASK_NOT_FOUND"
 
 
-@dataclass(kw_only=True)
+CHALLENGE_ABORTED_REASONS = {m.value: m for m in ChallengeAbortedReason}
+
+
+@dataclass(kw_only=True, slots=True)
 class Challenge:
     """Challenge task data."""
 
-    id: UUID | None = None
+    id: UUID | None = field(
+        default=None, metadata=field_options(deserialize=serialize_uuid)
+    )
     taskId: UUID | None = None
     shortName: str | None = None
-    broken: ChallengeAbortedReason | None = None
+    broken: ChallengeAbortedReason | None = field(
+        default=None,
+        metadata=field_options(deserialize=CHALLENGE_ABORTED_REASONS.__getitem__),
+    )
     winner: str | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Reminders:
     """Task reminders data."""
 
@@ -842,7 +895,7 @@ class Reminders:
     startDate: datetime | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Checklist:
     """Task checklist data."""
 
@@ -860,6 +913,9 @@ class TaskType(StrEnum):
     REWARD = "reward"
 
 
+TASK_TYPES = {m.value: m for m in TaskType}
+
+
 class Attributes(StrEnum):
     """Character attributes enum."""
 
@@ -869,6 +925,9 @@ class Attributes(StrEnum):
     PER = "per"
 
 
+ATTRIBUTES = {m.value: m for m in Attributes}
+
+
 class Frequency(StrEnum):
     """Recurrence frequency enum."""
 
@@ -878,6 +937,9 @@ class Frequency(StrEnum):
     YEARLY = "yearly"
 
 
+FREQUENCIES = {m.value: m for m in Frequency}
+
+
 class Task(TypedDict("Task", {"type": NotRequired[TaskType]}), total=True):
     """Representation of a task."""
 
@@ -905,30 +967,41 @@ class Task(TypedDict("Task", {"type": NotRequired[TaskType]}), total=True):
     streak: NotRequired[int]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TaskData:
     """Task data."""
 
     challenge: Challenge = field(default_factory=Challenge)
     group: GroupTask = field(default_factory=GroupTask)
-    Type: TaskType | None = field(default=None, metadata=field_options(alias="type"))
+    Type: TaskType | None = field(
+        default=None,
+        metadata=field_options(alias="type", deserialize=TASK_TYPES.__getitem__),
+    )
     text: str | None = None
     notes: str | None = None
-    tags: list[UUID] | None = None
+    tags: list[UUID] | None = field(
+        default=None, metadata=field_options(deserialize=serialize_uuid_list)
+    )
     value: float | None = None
     priority: TaskPriority | None = None
-    attribute: Attributes | None = None
+    attribute: Attributes | None = field(
+        default=None, metadata=field_options(deserialize=ATTRIBUTES.__getitem__)
+    )
     byHabitica: bool | None = None
     createdAt: datetime | None = None
     updatedAt: datetime | None = None
     date: datetime | None = None
     id: UUID | None = None
-    userId: UUID | None = None
+    userId: UUID | None = field(
+        default=None, metadata=field_options(deserialize=serialize_uuid)
+    )
     up: bool | None = None
     down: bool | None = None
     counterUp: int | None = None
     counterDown: int | None = None
-    frequency: Frequency | None = None
+    frequency: Frequency | None = field(
+        default=None, metadata=field_options(deserialize=FREQUENCIES.__getitem__)
+    )
     history: list[EntryHistory] | None = None
     alias: str | None = None
     everyX: int | None = None
@@ -939,7 +1012,7 @@ class TaskData:
     weeksOfMonth: list[int] = field(default_factory=list)
     nextDue: list[datetime] = field(
         default_factory=list,
-        metadata=field_options(deserialize=lambda x: list(map(serialize_datetime, x))),
+        metadata=field_options(deserialize=serialize_datetime_list),
     )
     yesterDaily: bool | None = None
     completed: bool | None = None
@@ -949,30 +1022,35 @@ class TaskData:
     repeat: Repeat = field(default_factory=Repeat)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HabiticaTasksResponse(HabiticaResponse):
     """Repesentation of a tasks data response."""
 
     data: list[TaskData]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HabiticaTaskResponse(HabiticaResponse):
     """Repesentation of a single task data response."""
 
     data: TaskData
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HabiticaErrorResponse(DataClassORJSONMixin):
     """Base class for Habitica errors."""
 
+    class Config(BaseConfig):
+        """Configuration options."""
+
+        lazy_compilation = True
+
     success: bool
     error: str
     message: str
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TasksUserExport:
     """Tasks user export data."""
 
@@ -982,7 +1060,7 @@ class TasksUserExport:
     rewards: list[TaskData] = field(default_factory=list)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BuffsUserStyles:
     """Buffs UserStyles data."""
 
@@ -995,15 +1073,18 @@ class BuffsUserStyles:
     spookySparkles: bool | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class StatsUserStyles:
     """Stats user styles data."""
 
     buffs: BuffsUserStyles = field(default_factory=BuffsUserStyles)
-    Class: HabiticaClass = field(default=HabiticaClass.WARRIOR)
+    Class: HabiticaClass = field(
+        default=HabiticaClass.WARRIOR,
+        metadata=field_options(deserialize=HABITICA_CLASSES.__getitem__),
+    )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class GearItemsUserStyles:
     """Items gear data."""
 
@@ -1011,7 +1092,7 @@ class GearItemsUserStyles:
     costume: EquippedGear = field(default_factory=EquippedGear)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ItemsUserStyles:
     """Items user styles data."""
 
@@ -1020,7 +1101,7 @@ class ItemsUserStyles:
     currentPet: str | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PreferencesUserStyles:
     """Preferences user styles data."""
 
@@ -1034,23 +1115,33 @@ class PreferencesUserStyles:
     background: str | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class UserStyles(DataClassORJSONMixin):
     """Represents minimalistic data only containing user styles."""
 
+    class Config(BaseConfig):
+        """Configuration options."""
+
+        lazy_compilation = True
+
     items: ItemsUserStyles = field(default_factory=ItemsUserStyles)
     preferences: PreferencesUserStyles = field(default_factory=PreferencesUserStyles)
     stats: StatsUserStyles = field(default_factory=StatsUserStyles)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HabiticaUserExport(UserData, DataClassORJSONMixin):
     """Representation of a user data export."""
 
+    class Config(BaseConfig):
+        """Configuration options."""
+
+        lazy_compilation = True
+
     tasks: TasksUserExport = field(default_factory=TasksUserExport)
 
 
-@dataclass
+@dataclass(slots=True)
 class UserAnonymizedData:
     """Anonymized user data."""
 
@@ -1058,21 +1149,26 @@ class UserAnonymizedData:
     tasks: list[TaskData] = field(default_factory=list)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HabiticaUserAnonymizedrResponse(DataClassORJSONMixin):
     """Representation of a anonymized user data export."""
 
+    class Config(BaseConfig):
+        """Configuration options."""
+
+        lazy_compilation = True
+
     data: UserAnonymizedData
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HabiticaStatsResponse(HabiticaResponse):
     """Representation of a response containing stats data."""
 
     data: StatsUser
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class QuestTmpScore:
     """Represents the quest progress details."""
 
@@ -1080,7 +1176,7 @@ class QuestTmpScore:
     collection: int | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class DropTmpScore:
     """Represents the details of an item drop."""
 
@@ -1092,7 +1188,7 @@ class DropTmpScore:
     dialog: str | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TmpScore:
     """Temporary quest and drop data."""
 
@@ -1100,7 +1196,7 @@ class TmpScore:
     drop: DropTmpScore = field(default_factory=DropTmpScore)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoreData(StatsUser):
     """Scora data."""
 
@@ -1110,28 +1206,28 @@ class ScoreData(StatsUser):
     )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HabiticaScoreResponse(HabiticaResponse, DataClassORJSONMixin):
     """Representation of a score response."""
 
     data: ScoreData
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HabiticaTagsResponse(HabiticaResponse, DataClassORJSONMixin):
     """Representation of a score response."""
 
     data: list[TagsUser]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HabiticaTagResponse(HabiticaResponse, DataClassORJSONMixin):
     """Representation of a score response."""
 
     data: TagsUser
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class QuestData:
     """Quest data."""
 
@@ -1143,14 +1239,14 @@ class QuestData:
     leader: UUID | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HabiticaQuestResponse(HabiticaResponse, DataClassORJSONMixin):
     """Representation of a quest response."""
 
     data: QuestData
 
 
-@dataclass
+@dataclass(slots=True)
 class ChangeClassData:
     """Change class data."""
 
@@ -1160,21 +1256,21 @@ class ChangeClassData:
     stats: StatsUser = field(default_factory=StatsUser)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HabiticaClassSystemResponse(HabiticaResponse, DataClassORJSONMixin):
     """Representation of a change-class response."""
 
     data: ChangeClassData
 
 
-@dataclass
+@dataclass(slots=True)
 class HabiticaTaskOrderResponse(HabiticaResponse):
     """Representation of a reorder task response."""
 
     data: list[UUID] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class HabiticaSleepResponse(HabiticaResponse):
     """Representation of a sleep response."""
 
@@ -1265,8 +1361,11 @@ class Direction(StrEnum):
     DOWN = "down"
 
 
-class TaskPriority(Enum):
-    """Task difficulties."""
+class TaskPriority(float, Enum):
+    """Task difficulties.
+
+    Members are floats, so they can be compared and sorted directly.
+    """
 
     TRIVIAL = 0.1
     EASY = 1
@@ -1274,7 +1373,7 @@ class TaskPriority(Enum):
     HARD = 2
 
 
-@dataclass
+@dataclass(slots=True)
 class AchievmentContent:
     """Achievment content data."""
 
@@ -1288,7 +1387,7 @@ class AchievmentContent:
     pluralTextKey: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AnimalColorAchievementContent:
     """animalColorAchievement content data."""
 
@@ -1299,7 +1398,7 @@ class AnimalColorAchievementContent:
     mountNotificationType: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AnimalSetAchievementContent:
     """animalSetAchievements content data."""
 
@@ -1309,7 +1408,7 @@ class AnimalSetAchievementContent:
     notificationType: str
 
 
-@dataclass
+@dataclass(slots=True)
 class StableAchievementContent:
     """stableAchievements content data."""
 
@@ -1317,7 +1416,7 @@ class StableAchievementContent:
     masterNotificationType: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PetSetCompleteAchievsContent:
     """petSetCompleteAchievs content data."""
 
@@ -1326,7 +1425,7 @@ class PetSetCompleteAchievsContent:
     petNotificationType: str
 
 
-@dataclass
+@dataclass(slots=True)
 class QuestBossRage:
     """QuestBossRage content data."""
 
@@ -1337,7 +1436,7 @@ class QuestBossRage:
     healing: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class QuestBoss:
     """QuestBoss content data."""
 
@@ -1348,7 +1447,7 @@ class QuestBoss:
     rage: QuestBossRage | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class QuestItem:
     """QuestItem content data."""
 
@@ -1357,7 +1456,7 @@ class QuestItem:
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class QuestDrop:
     """QuestDrop content data."""
 
@@ -1366,7 +1465,7 @@ class QuestDrop:
     items: list[QuestItem] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class QuestCollect:
     """QuestCollect content data."""
 
@@ -1374,7 +1473,7 @@ class QuestCollect:
     count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class QuestUnlockCondition:
     """QuestUnlockCondition content data."""
 
@@ -1382,7 +1481,7 @@ class QuestUnlockCondition:
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class QuestsContent:
     """petSetCompleteAchievs content data."""
 
@@ -1404,7 +1503,7 @@ class QuestsContent:
     group: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemListEntry:
     """ItemListEntry content data."""
 
@@ -1412,7 +1511,7 @@ class ItemListEntry:
     isEquipment: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemListContent:
     """ItemListContent content data."""
 
@@ -1433,7 +1532,7 @@ class ItemListContent:
     bundles: ItemListEntry
 
 
-@dataclass
+@dataclass(slots=True)
 class GearEntry:
     """GearEntry content data."""
 
@@ -1451,7 +1550,7 @@ class GearEntry:
     con: int
 
 
-@dataclass
+@dataclass(slots=True)
 class GearClass:
     """GearClass content data."""
 
@@ -1465,7 +1564,7 @@ class GearClass:
     healer: dict[str, GearEntry] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GearType:
     """GearType content data."""
 
@@ -1479,7 +1578,7 @@ class GearType:
     eyewear: GearClass
 
 
-@dataclass
+@dataclass(slots=True)
 class GearContent:
     """GearContent content data."""
 
@@ -1487,7 +1586,7 @@ class GearContent:
     flat: dict[str, GearEntry]
 
 
-@dataclass
+@dataclass(slots=True)
 class SpellEntry:
     """SpellEntry content data."""
 
@@ -1505,7 +1604,7 @@ class SpellEntry:
     silent: bool | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SpellsClass:
     """SpellsClass content data."""
 
@@ -1516,7 +1615,7 @@ class SpellsClass:
     special: dict[str, SpellEntry]
 
 
-@dataclass
+@dataclass(slots=True)
 class CarTypes:
     """CarTypes content data."""
 
@@ -1525,7 +1624,7 @@ class CarTypes:
     yearRound: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class SpecialItemEntry:
     """Item content data."""
 
@@ -1542,7 +1641,7 @@ class SpecialItemEntry:
     value: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EggEntry:
     """Egg content data."""
 
@@ -1554,7 +1653,7 @@ class EggEntry:
     notes: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HatchingPotionEntry:
     """Hatching potion content data."""
 
@@ -1568,7 +1667,7 @@ class HatchingPotionEntry:
     wacky: bool | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PetEntry:
     """Pet content data."""
 
@@ -1579,7 +1678,7 @@ class PetEntry:
     text: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class InventoryItemEntry:
     """Inventory item content data."""
 
@@ -1593,7 +1692,7 @@ class InventoryItemEntry:
     canDrop: bool | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentData:
     """Content data."""
 
@@ -1651,7 +1750,7 @@ class ContentData:
     # loginIncentives
 
 
-@dataclass
+@dataclass(slots=True)
 class HabiticaContentResponse(HabiticaResponse):
     """Representation of a content response."""
 
@@ -1,49 +1,63 @@
 """Tests for Habiticalib."""
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from functools import lru_cache
 import pathlib
 
+from aiohttp import ClientSession
 from aioresponses import CallbackResult, aioresponses
 import pytest
+from pytest_asyncio import is_async_test
 from yarl import URL
 
-from habiticalib.const import ASSETS_URL, DEFAULT_URL
+from habiticalib import Habitica
+from habiticalib.const import ASSETS_URL
 
 
-@pytest.fixture
-def api_url() -> URL:
-    """Return base API URL."""
-
-    return URL(DEFAULT_URL)
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Run all async tests in the session-wide event loop."""
+    session_scope_marker = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_scope_marker, append=False)
 
 
 def load_assets_fixture(url: URL, **kwargs) -> CallbackResult:
     """Load assets callback."""
     asset = pathlib.Path(url.path).name
-    return CallbackResult(body=load_bytes_fixture(asset))
+    return CallbackResult(body=load_fixture(asset))
 
 
-@pytest.fixture(name="mock_aiohttp", autouse=True)
-def aioclient_mock() -> Generator[aioresponses]:
-    """Mock Aiohttp client requests."""
+@pytest.fixture(scope="session")
+def aioresponses_session() -> Generator[aioresponses]:
+    """Patch Aiohttp client requests once for the whole test session."""
     with aioresponses(passthrough=[ASSETS_URL]) as m:
         yield m
 
 
-@lru_cache
-def load_fixture(filename: str) -> str:
-    """Load a fixture."""
+@pytest.fixture(name="mock_aiohttp", autouse=True)
+def aioclient_mock(aioresponses_session: aioresponses) -> Generator[aioresponses]:
+    """Mock Aiohttp client requests."""
+    yield aioresponses_session
+    aioresponses_session.clear()
+    aioresponses_session.requests.clear()
+
+
+@pytest.fixture(scope="session")
+async def client_session() -> AsyncGenerator[ClientSession]:
+    """Return an aiohttp client session shared by all tests."""
+    async with ClientSession() as session:
+        yield session
+
 
-    return (
-        pathlib.Path(__file__)
-        .parent.joinpath("fixtures", filename)
-        .read_text(encoding="utf-8")
-    )
+@pytest.fixture(name="habitica")
+def habitica_client(client_session: ClientSession) -> Habitica:
+    """Return a Habitica client for the mocked API."""
+    return Habitica(client_session, "test", "test")
 
 
 @lru_cache
-def load_bytes_fixture(filename: str) -> bytes:
+def load_fixture(filename: str) -> bytes:
     """Load a fixture."""
 
     return pathlib.Path(__file__).parent.joinpath("fixtures", filename).read_bytes()
@@ -5,12 +5,11 @@ from aiohttp import ClientSession
 from habiticalib import Habitica, __version__
 
 
-async def test_default_user_agent() -> None:
+def test_default_user_agent(client_session: ClientSession) -> None:
     """Test default user agent is set."""
 
-    async with ClientSession() as session:
-        habitica = Habitica(session)
-        assert habitica._headers["User-Agent"].startswith(f"Habiticalib/{__version__}")
-        assert habitica._headers["User-Agent"].endswith(
-            "+https://github.com/tr4nt0r/habiticalib)"
-        )
+    habitica = Habitica(client_session)
+    assert habitica._headers["User-Agent"].startswith(f"Habiticalib/{__version__}")
+    assert habitica._headers["User-Agent"].endswith(
+        "+https://github.com/tr4nt0r/habiticalib)"
+    )